@@ -1,38 +1,138 @@
 from __future__ import annotations
+import functools
+import gc
+import hashlib
 import json
+import operator
 import os
+import re
+import string
 import warnings
-from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List, Sequence, Set, Tuple
+from typing import Any, BinaryIO, Dict, List, Sequence, Set, Tuple
 import nfl_data_py as nfl
+import numpy as np
 import pandas as pd
 from pandas.errors import PerformanceWarning
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 warnings.simplefilter("ignore", PerformanceWarning)
 warnings.simplefilter("ignore", category=pd.errors.SettingWithCopyWarning)
 
 CURRENT_SEASON = 2025
 LEGACY_DRIVE_CACHE = "legacy_drives_cache.json"
+LEGACY_DRIVE_ROWS_PARQUET = "legacy_drives_rows.parquet"
+LEGACY_DRIVE_DELTA = "legacy_drives_delta.jsonl"
+PBP_SEASON_PARQUET_FMT = "pbp_{season}.parquet"
+# Compact the append-only delta back into the base cache once it outgrows this.
+DELTA_COMPACT_BYTES = 4 << 20
 QB_NAME_CACHE = "qb_name_cache.json"
+RENDER_STAMP = ".render_stamp"
+OUTPUT_HTML_FILES = (
+    "regular_season_legacy_drives_leaderboard.html",
+    "post_season_legacy_drives_leaderboard.html",
+    "recent_legacy_drives.html",
+)
 
 Opportunity = Dict[str, Any]
 LegacyDriveData = Dict[str, Any]
 
+# nfl_data_py returns ~370 pbp columns; these are the only ones this script reads.
+PBP_NEEDED_COLS = (
+    "game_id", "drive", "play_id", "qtr", "posteam", "defteam",
+    "posteam_score", "defteam_score", "posteam_score_post", "defteam_score_post",
+    "touchdown", "td_team", "field_goal_result", "pass_attempt", "passer_id",
+    "qb_id", "desc", "play_type", "down", "ydstogo", "time",
+    "quarter_seconds_remaining", "game_seconds_remaining",
+    "season", "week", "season_type", "home_team", "away_team",
+)
+PBP_INT_COLS = (
+    "qtr", "down", "ydstogo", "posteam_score", "defteam_score",
+    "posteam_score_post", "defteam_score_post", "season", "week",
+)
+PBP_CAT_COLS = (
+    "game_id", "posteam", "defteam", "td_team", "qb_id", "passer_id",
+    "play_type", "field_goal_result", "season_type",
+)
+
 def load_legacydrive_cache(legacy_drive_cache: str = LEGACY_DRIVE_CACHE) -> Tuple[List[Opportunity], Set[str], int, List[LegacyDriveData]]:
     if not os.path.exists(legacy_drive_cache):
         return [], set(), 2000, []
 
-    with open(legacy_drive_cache, "r", encoding="utf-8") as f:
-        data = json.load(f) or {}
+    if orjson is not None:
+        with open(legacy_drive_cache, "rb") as f:
+            data = orjson.loads(f.read()) or {}
+    else:
+        with open(legacy_drive_cache, "r", encoding="utf-8") as f:
+            data = json.load(f) or {}
 
     opportunities = data.get("opportunities", []) or []
     processed_games = set(data.get("processed_games", []) or [])
     last_season_processed = int(data.get("last_season_processed", 2000) or 2000)
+
+    # Bulk rows live in a parquet sidecar; older caches kept them inline in the JSON.
     legacydrive_rows = data.get("legacydrive_rows") or []
+    rows_parquet = data.get("legacydrive_rows_parquet")
+    if rows_parquet:
+        # A dangling pointer must be fatal: silently continuing with zero rows
+        # would let the next full save persist the empty list while
+        # processed_games still claims the games were handled — permanent,
+        # unnoticed loss of every cached row.
+        if not os.path.exists(rows_parquet):
+            raise FileNotFoundError(
+                f"{legacy_drive_cache} points at missing rows sidecar "
+                f"'{rows_parquet}'. Restore it, or delete the cache to rebuild."
+            )
+        df = pd.read_parquet(rows_parquet)
+        legacydrive_rows = df.astype(object).where(pd.notna(df), None).to_dict("records")
+
+    # Replay any append-only deltas written since the last full save.
+    if os.path.exists(LEGACY_DRIVE_DELTA):
+        with open(LEGACY_DRIVE_DELTA, "rb") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                entry = orjson.loads(line) if orjson is not None else json.loads(line)
+                opportunities.extend(entry.get("opportunities") or [])
+                legacydrive_rows.extend(entry.get("legacydrive_rows") or [])
+                processed_games.update(entry.get("processed_games") or [])
+                last_season_processed = max(
+                    last_season_processed, int(entry.get("last_season_processed") or 0)
+                )
 
     return opportunities, processed_games, last_season_processed, legacydrive_rows
 
+def append_legacydrive_cache(
+    new_opportunities: Sequence[Opportunity],
+    new_games: Set[str],
+    last_season_processed: int,
+    new_rows: Sequence[LegacyDriveData],
+) -> None:
+    # O(delta) save path: one JSONL line holding only this run's additions.
+    entry = {
+        "opportunities": list(new_opportunities),
+        "processed_games": sorted(new_games),
+        "last_season_processed": int(last_season_processed),
+        "legacydrive_rows": list(new_rows),
+    }
+    if orjson is not None:
+        line = orjson.dumps(entry, default=str)
+    else:
+        line = json.dumps(entry, default=str).encode("utf-8")
+    with open(LEGACY_DRIVE_DELTA, "ab") as f:
+        f.write(line + b"\n")
+
 def save_legacydrive_cache(
     opportunities: Sequence[Opportunity],
     processed_games: Set[str],
@@ -41,85 +141,184 @@ def save_legacydrive_cache(
     legacy_drive_cache: str = LEGACY_DRIVE_CACHE,
 ) -> None:
     payload = {
-        "opportunities": list(opportunities),
-        "processed_games": list(processed_games),
+        "opportunities": opportunities if isinstance(opportunities, list) else list(opportunities),
+        "processed_games": sorted(processed_games),
         "last_season_processed": int(last_season_processed),
-        "legacydrive_rows": list(legacydrive_rows),
         "last_updated": datetime.now().isoformat(),
     }
-    with open(legacy_drive_cache, "w", encoding="utf-8") as f:
-        json.dump(payload, f)
+    rows = legacydrive_rows if isinstance(legacydrive_rows, list) else list(legacydrive_rows)
+    try:
+        pd.DataFrame(rows).to_parquet(LEGACY_DRIVE_ROWS_PARQUET, compression="zstd")
+        payload["legacydrive_rows_parquet"] = LEGACY_DRIVE_ROWS_PARQUET
+    except Exception:
+        # No parquet engine available; keep the rows inline as before.
+        payload["legacydrive_rows"] = rows
+    if orjson is not None:
+        with open(legacy_drive_cache, "wb") as f:
+            f.write(orjson.dumps(payload))
+    else:
+        with open(legacy_drive_cache, "w", encoding="utf-8") as f:
+            json.dump(payload, f)
+    # A full save captures everything the delta held. Truncate the file
+    # rather than removing it: its presence at the next load proves the
+    # delta survives between runs in this environment, which is what the
+    # append fast path in main() requires before it may skip a full save.
+    with open(LEGACY_DRIVE_DELTA, "wb"):
+        pass
+
+@functools.lru_cache(maxsize=4)
+def _load_name_map_cached(qb_name_cache: str, mtime: float) -> Dict[str, str]:
+    # mtime is only part of the memo key; a changed file busts the entry.
+    with open(qb_name_cache, "r", encoding="utf-8") as f:
+        return json.load(f) or {}
 
 def load_persistent_name_map(qb_name_cache: str = QB_NAME_CACHE) -> Dict[str, str]:
     if not os.path.exists(qb_name_cache):
         return {}
-    with open(qb_name_cache, "r", encoding="utf-8") as f:
-        return json.load(f) or {}
+    # Copy so callers can mutate their map without poisoning the memo.
+    return dict(_load_name_map_cached(qb_name_cache, os.path.getmtime(qb_name_cache)))
 
 def save_persistent_name_map(name_map: Dict[str, str], qb_name_cache: str = QB_NAME_CACHE) -> None:
     with open(qb_name_cache, "w", encoding="utf-8") as f:
         json.dump(name_map, f)
 
+def _first_name_map(pbp: pd.DataFrame, id_col: str, name_col: str) -> Dict[Any, str]:
+    # drop_duplicates on the id column is one hash pass over two columns; no
+    # grouper construction or aggregation dispatch like groupby(...).first().
+    sub = pbp[[id_col, name_col]].dropna().drop_duplicates(subset=id_col, keep="first")
+    return dict(zip(sub[id_col].to_numpy(), sub[name_col].to_numpy()))
+
 def seasons_to_load(last_season_processed: int, current_season: int) -> List[int]:
     if last_season_processed < current_season - 1:
         return list(range(last_season_processed, current_season + 1))
     return [current_season]
 
+def _import_season_pbp(season: int) -> pd.DataFrame:
+    # Completed seasons never change: serve them from a local projected
+    # parquet snapshot when present, writing one on first download. Only the
+    # current season is always pulled fresh.
+    path = PBP_SEASON_PARQUET_FMT.format(season=season)
+    if season < CURRENT_SEASON and os.path.exists(path):
+        return pd.read_parquet(path)
+    try:
+        df = nfl.import_pbp_data([season], downcast=True, cache=season < CURRENT_SEASON)
+    except Exception:
+        # nfl_data_py cache not populated yet; fall back to a normal download.
+        df = nfl.import_pbp_data([season], downcast=True, cache=False)
+    if season < CURRENT_SEASON:
+        # Snapshot only the columns this script reads (plus the name columns
+        # the display maps use) — a fraction of the ~370-column download.
+        keep = [c for c in (*PBP_NEEDED_COLS, "passer", "qb") if c in df.columns]
+        try:
+            df[keep].to_parquet(path, compression="zstd")
+        except Exception:
+            # No parquet engine available; skip the snapshot.
+            pass
+    return df
+
 def import_pbp_all(seasons: Sequence[int]) -> pd.DataFrame:
-    pbp = nfl.import_pbp_data(list(seasons), downcast=True, cache=False)
-    return pbp
+    frames = [_import_season_pbp(s) for s in seasons]
+    if not frames:
+        return pd.DataFrame()
+    if len(frames) == 1:
+        return frames[0]
+    return pd.concat(frames, ignore_index=True, copy=False)
 
 def build_drive_starts(pbp_period: pd.DataFrame) -> pd.DataFrame:
-    return (
-        pbp_period.sort_values(["game_id", "drive", "play_id"])
-        .groupby(["game_id", "drive"], as_index=False)
-        .first()
+    # First play of each drive via argmin on play_id; avoids sorting the whole frame.
+    first_idx = pbp_period.groupby(["game_id", "drive"], sort=False, observed=True)["play_id"].idxmin()
+    starts = pbp_period.loc[first_idx].reset_index(drop=True)
+
+    # The min-play_id row can open a drive with null scores (e.g. a timeout
+    # row); the old sort+groupby.first took each column's first *valid* value,
+    # so backfill the score columns the same way when any came back NaN.
+    score_cols = [c for c in ("posteam_score", "defteam_score") if c in starts.columns]
+    if score_cols and starts[score_cols].isna().to_numpy().any():
+        first_valid = (
+            pbp_period.sort_values("play_id")
+            .groupby(["game_id", "drive"], sort=False, observed=True)[score_cols]
+            .first()
+        )
+        cols = starts.columns
+        keyed = starts.set_index(["game_id", "drive"])
+        keyed[score_cols] = keyed[score_cols].fillna(first_valid)
+        starts = keyed.reset_index()[list(cols)]
+    return starts
+
+def _modal_value_map(
+    sub: pd.DataFrame, keys: List[str], col: str
+) -> Dict[Tuple[Any, Any, str], Any]:
+    # Most common value of `col` per key tuple without any per-group Python:
+    # count (keys, value) combinations, stable-sort by count descending, keep
+    # the top row per key. Ties resolve to the first-seen value, matching the
+    # old value_counts().idxmax() behaviour.
+    counts = sub.groupby(keys + [col], sort=False, observed=True).size().reset_index(name="n")
+    top = counts.sort_values("n", ascending=False, kind="stable").drop_duplicates(subset=keys)
+    return dict(zip(map(tuple, top[keys].to_numpy()), top[col].to_numpy()))
+
+def build_drive_qb_maps(
+    pbp_late: pd.DataFrame,
+) -> Tuple[Dict[Tuple[Any, Any, str], Any], Dict[Tuple[Any, Any, str], Any]]:
+    # Most common qb_id / passer_id per (game_id, drive, period), computed in
+    # one grouped size/sort/dedup pass each instead of per-drive mode scans.
+    keys = ["game_id", "drive", "period"]
+
+    qb_map: Dict[Tuple[Any, Any, str], Any] = {}
+    if "qb_id" in pbp_late.columns:
+        sub = pbp_late.dropna(subset=["qb_id"])
+        if not sub.empty:
+            qb_map = _modal_value_map(sub, keys, "qb_id")
+
+    passer_map: Dict[Tuple[Any, Any, str], Any] = {}
+    if "pass_attempt" in pbp_late.columns and "passer_id" in pbp_late.columns:
+        sub = pbp_late[pbp_late["pass_attempt"] == 1].dropna(subset=["passer_id"])
+        if not sub.empty:
+            passer_map = _modal_value_map(sub, keys, "passer_id")
+
+    return qb_map, passer_map
+
+def build_final_play_map(
+    pbp_late: pd.DataFrame,
+) -> Dict[Tuple[Any, Any, str], Tuple[Any, Any, Any]]:
+    """Map (game_id, drive, period) -> (desc, down, ydstogo) of each drive's
+    final 'meaningful' play (skip XP/2PT/timeouts/end-game noise).
+
+    The mask and the final-play ordering are computed once over the whole
+    late-game frame; drop_duplicates then answers every drive in one pass
+    instead of re-filtering per opportunity.
+    """
+    if pbp_late.empty:
+        return {}
+    desc = (
+        pbp_late["desc"].fillna("").astype(str)
+        if "desc" in pbp_late.columns
+        else pd.Series("", index=pbp_late.index)
     )
-
-def get_qb_for_drive(
-    drive_all: pd.DataFrame,
-    drive_start_row: pd.Series,
-    qb_name_map: Dict[Any, str],
-    passer_name_map: Dict[Any, str],
-) -> Tuple[str, str]:
-    qb_id = None
-    qb_name = None
-
-    # Prefer qb_id/qb columns if present.
-    if "qb_id" in drive_all.columns:
-        qb_series = drive_all["qb_id"].dropna()
-        if not qb_series.empty:
-            qb_id = qb_series.mode().iloc[0]
-            qb_name = qb_name_map.get(qb_id)
-    # Fallback: most common passer_id on pass attempts.
-    if qb_id is None and "pass_attempt" in drive_all.columns:
-        drive_pass = drive_all[drive_all["pass_attempt"] == 1]
-        if not drive_pass.empty and "passer_id" in drive_pass.columns:
-            qb_counts = Counter(drive_pass["passer_id"].dropna())
-            if qb_counts:
-                qb_id = qb_counts.most_common(1)[0][0]
-                qb_name = passer_name_map.get(qb_id)
-    # Final fallback: team placeholder.
-    if qb_id is None:
-        qb_id = f"TEAM_{drive_start_row.get('posteam', 'UNK')}"
-        qb_name = qb_id
-
-    return str(qb_id), str(qb_name) if qb_name is not None else str(qb_id)
-
-def get_meaningful_final_play(drive_all: pd.DataFrame) -> pd.Series:
-    # Pick a 'meaningful' final play (skip XP/2PT/timeouts/end-game noise)
-    for _, row in drive_all.iterrows():
-        desc_txt = str(row.get("desc", "") or "")
-        ptype = row.get("play_type")
-
-        if (
-            ptype not in ["extra_point", "two_point_attempt"]
-            and "END GAME" not in desc_txt
-            and not desc_txt.strip().startswith("Timeout")
-            and not desc_txt.strip().startswith("TWO-POINT ATTEMPT")
-        ):
-            return row
-    return drive_all.iloc[0]
+    stripped = desc.str.lstrip()
+    meaningful = (
+        ~pbp_late["play_type"].isin(["extra_point", "two_point_attempt"])
+        & ~desc.str.contains("END GAME", regex=False)
+        & ~stripped.str.startswith("Timeout")
+        & ~stripped.str.startswith("TWO-POINT ATTEMPT")
+    )
+    sort_col = (
+        "game_seconds_remaining"
+        if "game_seconds_remaining" in pbp_late.columns
+        else "quarter_seconds_remaining"
+    )
+    ordered = pbp_late.sort_values([sort_col, "play_id"], ascending=[True, False], kind="stable")
+    keys = ["game_id", "drive", "period"]
+    cols = keys + ["desc", "down", "ydstogo"]
+    # Each drive's first row is the fallback; meaningful firsts override it.
+    first_all = ordered.drop_duplicates(subset=keys).reindex(columns=cols)
+    first_meaningful = (
+        ordered[meaningful.reindex(ordered.index)].drop_duplicates(subset=keys).reindex(columns=cols)
+    )
+    final_map: Dict[Tuple[Any, Any, str], Tuple[Any, Any, Any]] = {}
+    for frame in (first_all, first_meaningful):
+        arr = frame.to_numpy()
+        final_map.update(zip(map(tuple, arr[:, :3]), map(tuple, arr[:, 3:])))
+    return final_map
 
 def postseason_week_label(season: int | None, week: int | None) -> str | None:
     if season is None or week is None:
@@ -148,77 +347,222 @@ def time_to_seconds(t: Any) -> int:
     except Exception:
         return -1
 
+def _parse_mmss(t: str) -> int:
+    # Hand-rolled "MM:SS" parser (no split/int/try) so numba can compile it.
+    n = len(t)
+    i = 0
+    minutes = 0
+    ndig = 0
+    while i < n and t[i] != ":":
+        d = ord(t[i]) - 48
+        if d < 0 or d > 9:
+            return -1
+        minutes = minutes * 10 + d
+        ndig += 1
+        i += 1
+    if i >= n or ndig == 0:
+        return -1
+    i += 1
+    seconds = 0
+    ndig = 0
+    while i < n:
+        d = ord(t[i]) - 48
+        if d < 0 or d > 9:
+            return -1
+        seconds = seconds * 10 + d
+        ndig += 1
+        i += 1
+    if ndig == 0:
+        return -1
+    return minutes * 60 + seconds
+
+def _time_to_seconds_batch_impl(times) -> np.ndarray:
+    out = np.empty(len(times), dtype=np.int32)
+    for i in range(len(times)):
+        out[i] = _parse_mmss(times[i])
+    return out
+
+if numba is not None:
+    # cache=True persists the compiled kernels under __pycache__ so later runs
+    # skip the first-call LLVM compile.
+    _parse_mmss = numba.njit(cache=True)(_parse_mmss)
+    _time_to_seconds_batch_impl = numba.njit(cache=True)(_time_to_seconds_batch_impl)
+
+def time_to_seconds_batch(times: Sequence[Any]) -> np.ndarray:
+    clean = [t if isinstance(t, str) else "" for t in times]
+    if not clean:
+        return np.empty(0, dtype=np.int32)
+    if numba is not None:
+        return _time_to_seconds_batch_impl(numba.typed.List(clean))
+    return _time_to_seconds_batch_impl(clean)
+
 def sort_legacydrive_rows(rows: List[LegacyDriveData]) -> List[LegacyDriveData]:
-    return sorted(
-        rows,
-        key=lambda r: (
-            0 if str(r.get("season_type") or "").upper() == "REG" else 1,
-            int(r.get("season") or 0),
-            int(r.get("week") or 0),
-            str(r.get("game_id") or ""),
-            period_order(r.get("period")),
-            -time_to_seconds(r.get("start_time")),
-        ),
+    # Materialize the sort keys as columnar arrays and lexsort them in C;
+    # no Python tuples ever reach the sort's comparison layer.
+    n = len(rows)
+    if n == 0:
+        return []
+    if n > 1000:
+        start_secs = time_to_seconds_batch([r.get("start_time") for r in rows])
+    else:
+        start_secs = [time_to_seconds(r.get("start_time")) for r in rows]
+    st_ord = np.fromiter(
+        (0 if r.get("season_type") == "REG" else 1 for r in rows),
+        dtype=np.int8, count=n,
     )
+    season = np.fromiter((int(r.get("season") or 0) for r in rows), dtype=np.int32, count=n)
+    week = np.fromiter((int(r.get("week") or 0) for r in rows), dtype=np.int32, count=n)
+    period_ord = np.fromiter((period_order(r.get("period")) for r in rows), dtype=np.int8, count=n)
+    start_sec = np.asarray(start_secs, dtype=np.int32)
+    game_id = np.empty(n, dtype=object)
+    game_id[:] = [str(r.get("game_id") or "") for r in rows]
+    # lexsort keys run least- to most-significant.
+    order = np.lexsort((-start_sec, period_ord, game_id, week, season, st_ord))
+    return [rows[i] for i in order]
 
 def build_leaderboard_records(opportunities: Sequence[Opportunity], name_map: Dict[str, str]) -> pd.DataFrame:
     if not opportunities:
         return pd.DataFrame(columns=["qb_name", "wins", "losses", "win_pct"])
 
-    df = pd.DataFrame(opportunities)
-    records = (
-        df.pivot_table(index="qb_id", columns="result", aggfunc="size", fill_value=0)
-        .rename(columns={"W": "wins", "L": "losses"})
+    # Tally W/L straight off the list of dicts: factorize the ids and
+    # bincount each outcome per code. No DataFrame-from-dicts construction
+    # and no pivot machinery for what is two integer histograms.
+    n = len(opportunities)
+    qb_ids = np.empty(n, dtype=object)
+    is_win = np.empty(n, dtype=bool)
+    for i, o in enumerate(opportunities):
+        qb_ids[i] = str(o["qb_id"])
+        is_win[i] = o["result"] == "W"
+    codes, uniques = pd.factorize(qb_ids)
+    wins = np.bincount(codes[is_win], minlength=len(uniques))
+    losses = np.bincount(codes[~is_win], minlength=len(uniques))
+
+    # Exclude team placeholders and (defensively) ids with no decisions.
+    keep = np.fromiter(
+        (not u.startswith("TEAM_") for u in uniques), dtype=bool, count=len(uniques)
+    ) & ((wins + losses) > 0)
+    if not keep.any():
+        return pd.DataFrame(columns=["qb_name", "wins", "losses", "win_pct"])
+    uniques = uniques[keep]
+    wins = wins[keep]
+    losses = losses[keep]
+
+    decisions = (wins + losses).astype(float)
+    win_pct = np.round(wins / decisions * 100, 1)
+    # Stable multi-key ordering via lexsort on the raw arrays (last key is primary).
+    order = np.lexsort((-win_pct, losses, -wins))
+    # Wrap into a DataFrame only for the HTML emit.
+    return pd.DataFrame(
+        {
+            "qb_name": [name_map.get(u) for u in uniques[order]],
+            "wins": wins[order],
+            "losses": losses[order],
+            "win_pct": win_pct[order],
+        },
+        index=pd.Index(uniques[order], name="qb_id"),
     )
-    # Exclude team placeholders.
-    records = records[~records.index.astype(str).str.startswith("TEAM_")]
-
-    for c in ("wins", "losses"):
-        if c not in records.columns:
-            records[c] = 0
-
-    records["qb_name"] = records.index.map(name_map)
-    records["decisions"] = records["wins"] + records["losses"]
-    records["win_pct"] = records.apply(
-        lambda x: round(x["wins"] / x["decisions"] * 100, 1) if x["decisions"] > 0 else 0.0,
-        axis=1,
+
+def build_drive_outcomes(pbp_period: pd.DataFrame) -> pd.DataFrame:
+    # One groupby pass per period frame: own-team TD/FG flags plus the
+    # end-of-drive scores (first non-null value walking back from the last play).
+    outcome_cols = ["game_id", "drive", "td_scored", "fg_scored", "end_team_score", "end_opp_score", "end_time"]
+    if pbp_period.empty:
+        return pd.DataFrame(columns=outcome_cols)
+
+    period = pbp_period.copy()
+
+    if "touchdown" in period.columns:
+        if "td_team" in period.columns:
+            # Compare on the raw arrays: the two columns are categoricals with
+            # different category sets, which Series.eq refuses to compare.
+            period["_own_td"] = (period["touchdown"] == 1) & (
+                period["td_team"].to_numpy() == period["posteam"].to_numpy()
+            )
+        else:
+            period["_own_td"] = period["touchdown"] == 1
+    else:
+        period["_own_td"] = False
+
+    if "field_goal_result" in period.columns:
+        period["_own_fg"] = period["field_goal_result"] == "made"
+    else:
+        period["_own_fg"] = False
+
+    sort_col = (
+        "game_seconds_remaining"
+        if "game_seconds_remaining" in period.columns
+        else "quarter_seconds_remaining"
     )
-    records = records[records["decisions"] > 0]
-    records = records[["qb_name", "wins", "losses", "win_pct"]].sort_values(
-        ["wins", "losses", "win_pct"], ascending=[False, True, False]
+    period = period.sort_values(["game_id", "drive", sort_col, "play_id"], ascending=[True, True, True, False])
+
+    # groupby.first skips NaN, so "first" on the latest-play-first ordering is
+    # the most recent valid value (equivalent to the old per-drive ffill/bfill).
+    outcomes = period.groupby(["game_id", "drive"], as_index=False, sort=False, observed=True).agg(
+        td_scored=("_own_td", "any"),
+        fg_scored=("_own_fg", "any"),
+        end_team_score=("posteam_score_post", "first"),
+        end_opp_score=("defteam_score_post", "first"),
+        end_time=("time", "first"),
     )
-    return records
-
-def classify_ot_result(
-    *,
-    season_type: str,
-    season_val: int | None,
-    ot_rank: int,
-    td_scored: bool,
-    fg_scored: bool,
-    end_team_score: Any,
-    end_opp_score: Any,
-) -> Tuple[str, str]:
-    st = (season_type or "").upper()
-
-    if st == "POST" and season_val is not None and season_val < 2010:
-        if td_scored or fg_scored:
-            return "W", "OT (POST pre-2010): FG/TD scored on drive (Success)"
-        return "L", "OT (POST pre-2010): no FG/TD scored on drive (Failure)"
-
-    if st == "REG" and season_val is not None and season_val < 2012:
-        if td_scored or fg_scored:
-            return "W", "OT (REG pre-2012): FG/TD scored on drive (Success)"
-        return "L", "OT (REG pre-2012): no FG/TD scored on drive (Failure)"
-
-    if ot_rank == 1:
-        if td_scored:
-            return "W", "OT (1st drive): TD scored (Success)"
-        return "L", "OT (1st drive): no TD (FG or no score) (Failure)"
-
-    if end_team_score > end_opp_score:
-        return "W", f"OT (drive {ot_rank}): ended leading (Success)"
-    return "L", f"OT (drive {ot_rank}): ended not leading (Failure)"
+    return outcomes[outcome_cols]
+
+def classify_drive_results(opps: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+    # Vectorized W/L + reason assignment over the merged opportunity frame;
+    # np.select takes the first matching condition, mirroring the old branch order.
+    q4 = opps["period"].eq("Q4").to_numpy()
+    ot = ~q4
+
+    st = opps["season_type"].to_numpy()
+    season = pd.to_numeric(opps["season"], errors="coerce").to_numpy(dtype=float)
+    rank = opps["ot_drive_rank"].fillna(1).astype(int).to_numpy()
+    td = opps["td_scored"].fillna(False).to_numpy(dtype=bool)
+    fg = opps["fg_scored"].fillna(False).to_numpy(dtype=bool)
+    scored = td | fg
+    end_team = opps["end_team_score"].to_numpy(dtype=float)
+    end_opp = opps["end_opp_score"].to_numpy(dtype=float)
+
+    post_pre2010 = (st == "POST") & (season < 2010)
+    reg_pre2012 = (st == "REG") & (season < 2012)
+    first_drive = rank == 1
+
+    # Format one string per distinct rank (a handful of values) and fan out
+    # with a take, instead of one f-string per row.
+    uniq_ranks, rank_inv = np.unique(rank, return_inverse=True)
+    lead_reasons = np.array(
+        [f"OT (drive {k}): ended leading (Success)" for k in uniq_ranks], dtype=object
+    )[rank_inv]
+    trail_reasons = np.array(
+        [f"OT (drive {k}): ended not leading (Failure)" for k in uniq_ranks], dtype=object
+    )[rank_inv]
+
+    conditions = [
+        q4 & (end_team >= end_opp),
+        q4,
+        ot & post_pre2010 & scored,
+        ot & post_pre2010,
+        ot & reg_pre2012 & scored,
+        ot & reg_pre2012,
+        ot & first_drive & td,
+        ot & first_drive,
+        ot & (end_team > end_opp),
+    ]
+    results = np.select(conditions, ["W", "L", "W", "L", "W", "L", "W", "L", "W"], default="L")
+    reasons = np.select(
+        conditions,
+        [
+            "Q4: drive ended tied or leading (Success)",
+            "Q4: drive ended still trailing (Failure)",
+            "OT (POST pre-2010): FG/TD scored on drive (Success)",
+            "OT (POST pre-2010): no FG/TD scored on drive (Failure)",
+            "OT (REG pre-2012): FG/TD scored on drive (Success)",
+            "OT (REG pre-2012): no FG/TD scored on drive (Failure)",
+            "OT (1st drive): TD scored (Success)",
+            "OT (1st drive): no TD (FG or no score) (Failure)",
+            lead_reasons,
+        ],
+        default=trail_reasons,
+    )
+    return results, reasons
 
 def process_new_games(
     pbp: pd.DataFrame,
@@ -232,129 +576,132 @@ def process_new_games(
     if not new_games:
         return
 
-    pbp = pbp[pbp["game_id"].isin(new_games)]
+    # Caller passes pbp already restricted to new games (main filters on
+    # factorized game_id codes); rescanning game_id here would duplicate it.
     if pbp.empty:
         return
 
-    pbp_q4 = pbp[pbp["qtr"] == 4]
-    pbp_ot = pbp[pbp["qtr"] >= 5]
+    # Narrow the frame and shrink dtypes before the groupby-heavy section:
+    # fewer/narrower columns means less data shuffled by every sort/group below.
+    pbp = pbp[[c for c in PBP_NEEDED_COLS if c in pbp.columns]].copy()
+    for c in PBP_INT_COLS:
+        if c in pbp.columns:
+            pbp[c] = pd.to_numeric(pbp[c], downcast="integer")
+    for c in PBP_CAT_COLS:
+        if c in pbp.columns:
+            pbp[c] = pbp[c].astype("category")
+
+    # One read of qtr feeds both period masks instead of two column scans.
+    qtr = pbp["qtr"].to_numpy()
+    pbp_q4 = pbp.loc[qtr == 4]
+    pbp_ot = pbp.loc[qtr >= 5]
     drive_starts_q4 = build_drive_starts(pbp_q4)
-    drive_starts_q4["score_diff"] = drive_starts_q4["posteam_score"] - drive_starts_q4["defteam_score"]
-    q4_opps = drive_starts_q4[
-        (drive_starts_q4["quarter_seconds_remaining"] <= 180)
-        & (drive_starts_q4["quarter_seconds_remaining"] >= 0)
-        & (drive_starts_q4["score_diff"].between(-8, -1))
+    # Compute the diff and the four-way window on raw float arrays (scores
+    # can be NaN, so int8 is out); one fused mask instead of chained Series.
+    sd = (
+        drive_starts_q4["posteam_score"].to_numpy(dtype=float)
+        - drive_starts_q4["defteam_score"].to_numpy(dtype=float)
+    )
+    qsr_start = drive_starts_q4["quarter_seconds_remaining"].to_numpy(dtype=float)
+    drive_starts_q4["score_diff"] = sd
+    q4_opps = drive_starts_q4.loc[
+        (qsr_start >= 0) & (qsr_start <= 180) & (sd >= -8) & (sd <= -1)
     ].copy()
     q4_opps["period"] = "Q4"
+    q4_opps = q4_opps.merge(build_drive_outcomes(pbp_q4), on=["game_id", "drive"], how="left")
     drive_starts_ot = build_drive_starts(pbp_ot)
     drive_starts_ot["score_diff"] = drive_starts_ot["posteam_score"] - drive_starts_ot["defteam_score"]
     ot_opps = drive_starts_ot.copy()
     ot_opps["period"] = "OT"
-    ot_opps = ot_opps.sort_values(["game_id", "qtr", "play_id"])
-    ot_opps["ot_drive_rank"] = ot_opps.groupby("game_id").cumcount() + 1
+    # Rank OT drives per game on raw arrays: lexsort on factor codes (last
+    # key is primary) makes each game's drives contiguous, then the rank is
+    # the row's offset from its game's first row — no groupby scan needed.
+    game_codes = pd.factorize(ot_opps["game_id"])[0]
+    order = np.lexsort(
+        (ot_opps["play_id"].to_numpy(), ot_opps["qtr"].to_numpy(), game_codes)
+    )
+    ot_opps = ot_opps.iloc[order]
+    game_sorted = game_codes[order]
+    idx = np.arange(len(order))
+    new_game = np.ones(len(order), dtype=bool)
+    new_game[1:] = game_sorted[1:] != game_sorted[:-1]
+    group_start = np.maximum.accumulate(np.where(new_game, idx, 0))
+    ot_opps["ot_drive_rank"] = idx - group_start + 1
+    ot_opps = ot_opps.merge(build_drive_outcomes(pbp_ot), on=["game_id", "drive"], how="left")
     opps = pd.concat([q4_opps, ot_opps], ignore_index=True)
-    pbp_q4_grouped = pbp_q4.groupby(["game_id", "drive"])
-    pbp_ot_grouped = pbp_ot.groupby(["game_id", "drive"])
-
-    for _, row in opps.iterrows():
-        game_id = row["game_id"]
-        drive_num = row["drive"]
-        period = row.get("period", "Q4")
-        season_type = str(row.get("season_type") or "").upper() or "REG"
+    if "ot_drive_rank" not in opps.columns:
+        opps["ot_drive_rank"] = np.nan
+    # The drive-start intermediates are folded into opps now; drop them so the
+    # groupby-heavy stretch below runs against a smaller working set.
+    del drive_starts_q4, drive_starts_ot, q4_opps, ot_opps
+    gc.collect()
+
+    # Drop drives with no usable end score (old per-drive "continue" path).
+    opps = opps[opps["end_team_score"].notna() & opps["end_opp_score"].notna()].copy()
+    if opps.empty:
+        return
 
-        try:
-            drive_all = (
-                pbp_q4_grouped.get_group((game_id, drive_num)).copy()
-                if period == "Q4"
-                else pbp_ot_grouped.get_group((game_id, drive_num)).copy()
-            )
-        except KeyError:
+    # Normalize season_type once, columnar, instead of str(...).upper() per row.
+    # (astype(object) first: fillna("") is invalid on a categorical column.)
+    if "season_type" in opps.columns:
+        opps["season_type"] = (
+            opps["season_type"].astype(object).fillna("").astype(str).str.upper().replace("", "REG")
+        )
+    else:
+        opps["season_type"] = "REG"
+
+    results, reasons = classify_drive_results(opps)
+    opps["result"] = results
+    opps["reason"] = reasons
+
+    # Legacy rule: skip Q4 opportunities that start with <= 0:30 left and end in failure.
+    qsr = opps["quarter_seconds_remaining"].to_numpy(dtype=float)
+    late_q4_loss = opps["period"].eq("Q4").to_numpy() & (qsr <= 30) & (results == "L")
+    opps = opps[~late_q4_loss]
+
+    # One grouper for both periods; the period tag keeps drive keys unambiguous.
+    pbp_late = pd.concat([pbp_q4.assign(period="Q4"), pbp_ot.assign(period="OT")], copy=False)
+    qb_map, passer_map = build_drive_qb_maps(pbp_late)
+    final_play_map = build_final_play_map(pbp_late)
+
+    for row in opps.itertuples(index=False):
+        game_id = row.game_id
+        drive_num = row.drive
+        period = getattr(row, "period", "Q4")
+        season_type = row.season_type
+
+        drive_key = (game_id, drive_num, period)
+        final_play = final_play_map.get(drive_key)
+        if final_play is None:
             continue
 
-        qb_id, qb_name = get_qb_for_drive(drive_all, row, qb_name_map, passer_name_map)
+        qb_id = qb_map.get(drive_key)
+        passer_id = passer_map.get(drive_key)
 
-        sort_col = (
-            "game_seconds_remaining"
-            if "game_seconds_remaining" in drive_all.columns
-            else "quarter_seconds_remaining"
-        )
-        drive_all = drive_all.sort_values([sort_col, "play_id"], ascending=[True, False])
-
-        for c in ("posteam_score_post", "defteam_score_post"):
-            if c in drive_all.columns:
-                drive_all[c] = drive_all[c].ffill().bfill()
-
-        last_play = drive_all.iloc[0]
-        end_team_score = last_play.get("posteam_score_post", pd.NA)
-        end_opp_score = last_play.get("defteam_score_post", pd.NA)
-
-        if pd.isna(end_team_score) or pd.isna(end_opp_score):
-            candidates = drive_all.dropna(subset=["posteam_score_post", "defteam_score_post"])
-            if candidates.empty:
-                continue
-            last_play = candidates.iloc[0]
-            end_team_score = last_play["posteam_score_post"]
-            end_opp_score = last_play["defteam_score_post"]
-
-        if period == "Q4":
-            if end_team_score >= end_opp_score:
-                result = "W"
-                reason = "Q4: drive ended tied or leading (Success)"
-            else:
-                result = "L"
-                reason = "Q4: drive ended still trailing (Failure)"
+        if qb_id is not None:
+            qb_name = qb_name_map.get(qb_id)
+        elif passer_id is not None:
+            qb_id = passer_id
+            qb_name = passer_name_map.get(passer_id)
         else:
-            ot_rank = int(row.get("ot_drive_rank", 1))
-            start_posteam = row.get("posteam")
-
-            season_val = row.get("season")
-            try:
-                season_val = int(season_val) if pd.notna(season_val) else None
-            except (ValueError, TypeError):
-                season_val = None
-
-            td_scored = False
-            if "touchdown" in drive_all.columns:
-                if "td_team" in drive_all.columns and start_posteam is not None:
-                    td_scored = ((drive_all["touchdown"] == 1) & (drive_all["td_team"] == start_posteam)).any()
-                elif "posteam" in drive_all.columns and start_posteam is not None:
-                    td_scored = ((drive_all["touchdown"] == 1) & (drive_all["posteam"] == start_posteam)).any()
-                else:
-                    td_scored = (drive_all["touchdown"] == 1).any()
-
-            fg_scored = False
-            if "field_goal_result" in drive_all.columns:
-                if "posteam" in drive_all.columns and start_posteam is not None:
-                    fg_scored = ((drive_all["field_goal_result"] == "made") & (drive_all["posteam"] == start_posteam)).any()
-                else:
-                    fg_scored = (drive_all["field_goal_result"] == "made").any()
-
-            result, reason = classify_ot_result(
-                season_type=season_type,
-                season_val=season_val,
-                ot_rank=ot_rank,
-                td_scored=td_scored,
-                fg_scored=fg_scored,
-                end_team_score=end_team_score,
-                end_opp_score=end_opp_score,
-            )
+            # Final fallback: team placeholder.
+            qb_id = f"TEAM_{getattr(row, 'posteam', 'UNK')}"
+            qb_name = qb_id
+        qb_id = str(qb_id)
+        qb_name = str(qb_name) if qb_name is not None else qb_id
 
-        # Legacy rule: skip Q4 opportunities that start with <= 0:30 left and end in failure.
-        if period == "Q4":
-            start_qsr = row.get("quarter_seconds_remaining")
-            if pd.notna(start_qsr) and start_qsr <= 30 and result == "L":
-                continue
+        result = row.result
+        reason = row.reason
 
         # Cache opportunity WITH season_type so we can build REG and POST leaderboards from one cache.
         opportunities.append({"qb_id": qb_id, "result": result, "season_type": season_type})
-        final_row = get_meaningful_final_play(drive_all)
-        final_desc = final_row.get("desc")
-        final_down = final_row.get("down")
-        final_yds = final_row.get("ydstogo")
+        final_desc, final_down, final_yds = final_play
         final_down_str = f"{int(final_down)}down" if pd.notna(final_down) and int(final_down) > 0 else None
         final_yds_str = f"{int(final_yds)}yrdstogo" if pd.notna(final_yds) and int(final_yds) > 0 else None
-        season_int = int(row.get("season")) if pd.notna(row.get("season")) else None
-        week_int = int(row.get("week")) if pd.notna(row.get("week")) else None
+        season_val = getattr(row, "season", None)
+        week_val = getattr(row, "week", None)
+        season_int = int(season_val) if pd.notna(season_val) else None
+        week_int = int(week_val) if pd.notna(week_val) else None
         week_label = postseason_week_label(season_int, week_int) if season_type == "POST" else None
         legacydrive_rows.append(
             {
@@ -363,18 +710,18 @@ def process_new_games(
                 "season": season_int,
                 "week": week_int,
                 "week_label": week_label,
-                "away_team": row.get("away_team"),
-                "home_team": row.get("home_team"),
+                "away_team": getattr(row, "away_team", None),
+                "home_team": getattr(row, "home_team", None),
                 "game_id": game_id,
                 "period": period,
-                "start_score_diff": f"down {abs(int(row['score_diff']))}",
-                "start_time": row.get("time"),
-                "end_time": last_play.get("time"),
+                "start_score_diff": f"down {abs(int(row.score_diff))}",
+                "start_time": getattr(row, "time", None),
+                "end_time": getattr(row, "end_time", None),
                 "final_down": final_down_str,
                 "final_ydstogo": final_yds_str,
                 "final_play": final_desc,
-                "end_team_score": int(end_team_score),
-                "end_opp_score": int(end_opp_score),
+                "end_team_score": int(row.end_team_score),
+                "end_opp_score": int(row.end_opp_score),
                 "result": result,
                 "reason": reason,
             }
@@ -391,7 +738,9 @@ def _render_section(
 ) -> str:
     """Render the single-page leaderboard section (no tabs)."""
 
-    html = f"""
+    # Accumulate fragments and join once; repeated html += reallocates the
+    # whole string every iteration.
+    parts: List[str] = [f"""
       <h1>{title}</h1>
       <div class="subtitle">{subtitle}</div>
 
@@ -407,27 +756,63 @@ def _render_section(
       </div>
 
       <div class="leaderboard" id="leaderboard">
-"""
-
-    for _, row in records.iterrows():
-        qb_name = row["qb_name"]
+"""]
+
+    # Partition rows per QB once; legacydrive_rows arrives already in the
+    # display order (sort_legacydrive_rows uses the same key the client-side
+    # sort did), so each QB's slice needs no re-sort.
+    by_qb: Dict[str, List[LegacyDriveData]] = {}
+    for r in legacydrive_rows:
+        by_qb.setdefault(str(r.get("qb_name")), []).append(r)
+
+    row_fmt = _DETAILS_ROW_FMT.format
+    # itertuples hands back plain tuples; iterrows would box every record
+    # into a fresh Series.
+    for qb_name, wins, losses, win_pct in records[
+        ["qb_name", "wins", "losses", "win_pct"]
+    ].itertuples(index=False, name=None):
         safe_id = qb_name.replace(" ", "-")
-        html += (
+        parts.append(
             f'        <div class="qb-entry" data-qb="{qb_name}">'
-            f"{qb_name}: {int(row['wins'])} - {int(row['losses'])} ({row['win_pct']}%)"
+            f"{qb_name}: {int(wins)} - {int(losses)} ({win_pct}%)"
             "</div>\n"
         )
-        html += f'        <div class="qb-details" id="details-{safe_id}"></div>\n'
+        # Pre-render the details table server-side; the click handler only
+        # toggles visibility, and the page carries no JSON blob.
+        parts.append(f'        <div class="qb-details" id="details-{safe_id}">')
+        qb_rows = by_qb.get(str(qb_name))
+        if qb_rows:
+            parts.append(_DETAILS_TABLE_HEAD)
+            for r in qb_rows:
+                st = r.get("start_time") or ""
+                et = r.get("end_time") or ""
+                parts.append(
+                    row_fmt(
+                        "result-w" if r.get("result") == "W" else "result-l",
+                        esc(r.get("result") or ""),
+                        esc(r.get("season") or ""),
+                        esc(r.get("week_label") or r.get("week") or ""),
+                        esc(r.get("away_team") or ""),
+                        esc(r.get("home_team") or ""),
+                        esc(r.get("period") or ""),
+                        esc(r.get("start_score_diff") or ""),
+                        esc(f"{st}-{et}" if st and et else (st or et or "")),
+                        esc(r.get("final_down") or ""),
+                        esc(r.get("final_yds") or r.get("final_ydstogo") or ""),
+                        esc(r.get("final_play") or ""),
+                        esc(f"{r.get('end_team_score')}-{r.get('end_opp_score')}"),
+                        esc(r.get("reason") or ""),
+                    )
+                )
+            parts.append("</tbody></table>")
+        else:
+            parts.append("<p>No drives found for this QB.</p>")
+        parts.append("</div>\n")
 
-    embedded_data = json.dumps(legacydrive_rows)
-    html += f"""
+    parts.append("""
       </div>
-
-      <script>
-      window.__LD_DATA__ = {embedded_data};
-      </script>
-"""
-    return html
+""")
+    return "".join(parts)
 
 def generate_leaderboards_html(
     *,
@@ -655,125 +1040,22 @@ def generate_leaderboards_html(
       dropdown.style.display = "none";
     });
 
-    function getData() {
-      return Array.isArray(window.__LD_DATA__) ? window.__LD_DATA__ : [];
-    }
-
+    // Details tables are pre-rendered server-side; clicking only toggles
+    // visibility.
     entries.forEach(entry => {
       entry.addEventListener("click", () => {
         const qbName = entry.getAttribute("data-qb");
         const safeId = qbName.replace(/ /g, "-");
-        const detailsId = `details-${safeId}`;
-        const detailsEl = document.getElementById(detailsId);
+        const detailsEl = document.getElementById(`details-${safeId}`);
         if (!detailsEl) return;
 
-        // Toggle
         if (detailsEl.style.display === "block") {
           detailsEl.style.display = "none";
           return;
         }
 
-        // Close others
         hideAllDetails();
         detailsEl.style.display = "block";
-
-        const rows = getData();
-        let qbRows = rows.filter(r => r.qb_name === qbName);
-        if (qbRows.length === 0) {
-          const qbLower = qbName.toLowerCase();
-          qbRows = rows.filter(r => r.qb_name && r.qb_name.toLowerCase() === qbLower);
-        }
-
-        qbRows.sort((a, b) => {
-          const aSeason = Number(a.season || 0);
-          const bSeason = Number(b.season || 0);
-          if (aSeason !== bSeason) return aSeason - bSeason;
-
-          const aWeek = Number(a.week || 0);
-          const bWeek = Number(b.week || 0);
-          if (aWeek !== bWeek) return aWeek - bWeek;
-
-          const aGame = String(a.game_id || "");
-          const bGame = String(b.game_id || "");
-          if (aGame !== bGame) return aGame.localeCompare(bGame);
-
-          const periodOrder = (p) => (p === "Q4" ? 4 : (p === "OT" ? 5 : 99));
-          const aP = periodOrder(a.period);
-          const bP = periodOrder(b.period);
-          if (aP !== bP) return aP - bP;
-
-          const toSec = (t) => {
-            if (!t) return -1;
-            const parts = String(t).split(":");
-            if (parts.length !== 2) return -1;
-            const m = Number(parts[0]);
-            const s = Number(parts[1]);
-            if (Number.isNaN(m) || Number.isNaN(s)) return -1;
-            return m * 60 + s;
-          };
-
-          return toSec(b.start_time) - toSec(a.start_time);
-        });
-
-        if (qbRows.length === 0) {
-          detailsEl.innerHTML = "<p>No drives found for this QB.</p>";
-          return;
-        }
-
-        let tableHtml = `
-          <table>
-            <thead>
-              <tr>
-                <th>Result</th>
-                <th>Year</th>
-                <th>Week</th>
-                <th>Away Team</th>
-                <th>Home Team</th>
-                <th>Period</th>
-                <th>Score Diff</th>
-                <th>Time Range</th>
-                <th>Down</th>
-                <th>Yards To Go</th>
-                <th>Final Play of Drive</th>
-                <th>New Score</th>
-                <th>Result Explanation</th>
-              </tr>
-            </thead>
-            <tbody>
-        `;
-
-        qbRows.forEach(drive => {
-          const resultClass = drive.result === 'W' ? 'result-w' : 'result-l';
-          const timeRange = (drive.start_time && drive.end_time)
-            ? `${drive.start_time}-${drive.end_time}`
-            : (drive.start_time || drive.end_time || '');
-          const finalScore = `${drive.end_team_score}-${drive.end_opp_score}`;
-          const wk = drive.week_label || drive.week || '';
-
-          tableHtml += `
-            <tr>
-              <td class="${resultClass}">${drive.result || ''}</td>
-              <td>${drive.season || ''}</td>
-              <td>${wk}</td>
-              <td>${drive.away_team || ''}</td>
-              <td>${drive.home_team || ''}</td>
-              <td>${drive.period || ''}</td>
-              <td>${drive.start_score_diff || ''}</td>
-              <td>${timeRange}</td>
-              <td>${drive.final_down || ''}</td>
-              <td>${drive.final_yds || drive.final_ydstogo || ''}</td>
-              <td>${drive.final_play || ''}</td>
-              <td>${finalScore}</td>
-              <td>${drive.reason || ''}</td>
-            </tr>
-          `;
-        });
-
-        tableHtml += `
-            </tbody>
-          </table>
-        `;
-        detailsEl.innerHTML = tableHtml;
       });
     });
 
@@ -808,137 +1090,117 @@ def generate_leaderboards_html(
     )
     return reg_html, post_html
 
-def generate_recent_legacy_drives_html(all_rows: List[LegacyDriveData]) -> str:
-    generated_ts = datetime.now().strftime("%Y-%m-%d %H:%M")
-    min_season = CURRENT_SEASON - 4
-
-    rows = [r for r in (all_rows or []) if int(r.get("season") or 0) >= min_season]
-
-    def period_order_desc(p: Any) -> int:
-        if p == "OT":
-            return 2
-        if p == "Q4":
-            return 1
-        return 0
-
-    def time_to_seconds_safe(t: Any) -> int:
-        if not t or not isinstance(t, str) or ":" not in t:
-            return 999999
-        try:
-            m, s = t.split(":", 1)
-            return int(m) * 60 + int(s)
-        except Exception:
-            return 999999
-
-    rows.sort(
-        key=lambda r: (
-            -int(r.get("season") or 0),
-            -int(r.get("week") or 0),
-            str(r.get("game_id") or ""),
-            -period_order_desc(r.get("period")),
-            time_to_seconds_safe(r.get("start_time")),
-        )
-    )
+def period_order_desc(p: Any) -> int:
+    if p == "OT":
+        return 2
+    if p == "Q4":
+        return 1
+    return 0
+
+_MMSS_RE = re.compile(r"(\d+):(\d+)")
+
+def time_to_seconds_safe(t: Any) -> int:
+    # Regex match instead of split+int+try: no exception objects on bad input.
+    # fullmatch, not match: trailing garbage ("5:30abc", "12:34:56") must sort
+    # last like the old int() parse, not silently take the numeric prefix.
+    if not isinstance(t, str):
+        return 999999
+    m = _MMSS_RE.fullmatch(t)
+    if m is None:
+        return 999999
+    return int(m.group(1)) * 60 + int(m.group(2))
+
+_HTML_ESC_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"})
+
+# Every field the recent-drives row template reads, in template order; rows
+# are guaranteed to carry all of these keys (fresh rows by construction,
+# cached rows via _normalize_cached_rows) so a single C-level itemgetter can
+# fetch them instead of seventeen chained .get calls.
+_ROW_KEYS = (
+    "qb_name", "result", "season", "week_label", "week", "away_team",
+    "home_team", "period", "start_score_diff", "start_time", "end_time",
+    "final_down", "final_ydstogo", "final_play", "end_team_score",
+    "end_opp_score", "reason",
+)
+_row_get = operator.itemgetter(*_ROW_KEYS)
 
-    def esc(x: Any) -> str:
-        s = "" if x is None else str(x)
-        return (
-            s.replace("&", "&amp;")
-             .replace("<", "&lt;")
-             .replace(">", "&gt;")
-             .replace('"', "&quot;")
-        )
+# Static skeleton for one recent-drives table row; built once so the loop does
+# a single format call per row instead of re-assembling the tag literals.
+_RECENT_ROW_FMT = (
+    '<tr><td>{}</td><td class="{}">{}</td><td>{}</td><td>{}</td><td>{}</td><td>{}</td>'
+    "<td>{}</td><td>{}</td><td>{}</td><td>{}</td><td>{}</td><td>{}</td><td>{}</td><td>{}</td></tr>"
+)
+# Skeletons for the pre-rendered per-QB details tables on the leaderboard
+# pages; same build-once pattern as the recent-drives row template.
+_DETAILS_TABLE_HEAD = (
+    "<table><thead><tr>"
+    "<th>Result</th><th>Year</th><th>Week</th><th>Away Team</th><th>Home Team</th>"
+    "<th>Period</th><th>Score Diff</th><th>Time Range</th><th>Down</th>"
+    "<th>Yards To Go</th><th>Final Play of Drive</th><th>New Score</th>"
+    "<th>Result Explanation</th>"
+    "</tr></thead><tbody>"
+)
+_DETAILS_ROW_FMT = (
+    '<tr><td class="{}">{}</td><td>{}</td><td>{}</td><td>{}</td><td>{}</td><td>{}</td>'
+    "<td>{}</td><td>{}</td><td>{}</td><td>{}</td><td>{}</td><td>{}</td><td>{}</td></tr>"
+)
 
-    table_rows = []
-    for r in rows:
-        qb = esc(r.get("qb_name") or "")
-        result = esc(r.get("result") or "")
-        season = esc(r.get("season") or "")
-        wk = r.get("week_label") or r.get("week") or ""
-        wk = esc(wk)
-        away = esc(r.get("away_team") or "")
-        home = esc(r.get("home_team") or "")
-        period = esc(r.get("period") or "")
-        diff = esc(r.get("start_score_diff") or "")
-        st = r.get("start_time") or ""
-        et = r.get("end_time") or ""
-        time_range = esc(f"{st}-{et}" if st and et else (st or et or ""))
-        down = esc(r.get("final_down") or "")
-        ytg = esc(r.get("final_ydstogo") or "")
-        final_play = esc(r.get("final_play") or "")
-        new_score = esc(f"{r.get('end_team_score')}-{r.get('end_opp_score')}")
-        reason = esc(r.get("reason") or "")
-
-        result_class = "result-w" if r.get("result") == "W" else "result-l"
-
-        table_rows.append(
-            f"<tr>"
-            f"<td>{qb}</td>"
-            f"<td class=\"{result_class}\">{result}</td>"
-            f"<td>{season}</td>"
-            f"<td>{wk}</td>"
-            f"<td>{away}</td>"
-            f"<td>{home}</td>"
-            f"<td>{period}</td>"
-            f"<td>{diff}</td>"
-            f"<td>{time_range}</td>"
-            f"<td>{down}</td>"
-            f"<td>{ytg}</td>"
-            f"<td>{final_play}</td>"
-            f"<td>{new_score}</td>"
-            f"<td>{reason}</td>"
-            f"</tr>"
-        )
+# Bytes twin for the streamed writer: %-formatting is the bytes equivalent of
+# str.format, and pre-encoded fragments skip the per-chunk UTF-8 encode a text
+# handle would do on write.
+_RECENT_ROW_FMT_B = _RECENT_ROW_FMT.replace("{}", "%s").encode("ascii")
 
-    return f"""<!DOCTYPE html>
+# Document skeleton for the recent-drives page, parsed once at import;
+# string.Template.substitute is a single regex pass per render.
+_RECENT_HEADER_TMPL = string.Template("""<!DOCTYPE html>
 <html lang="en">
 <head>
   <meta charset="UTF-8">
   <meta name="viewport" content="width=device-width, initial-scale=1.0">
   <title>Recent Legacy Drives (REG + POST)</title>
   <style>
-    body {{
+    body {
       font-family: 'Courier New', monospace;
       max-width: 1200px;
       margin: 40px auto;
       line-height: 1.6;
       padding: 0 12px;
       -webkit-text-size-adjust: 100%;
-    }}
-    .timestamp {{ 
+    }
+    .timestamp { 
         font-size: 10px;
         text-align: right;
-    }}
-    h1 {{ 
+    }
+    h1 { 
         font-size: 18px; font-weight: bold; margin: 0 0 5px; 
-    }}
-    .subtitle {{ 
+    }
+    .subtitle { 
         font-size: 12px;
-        }}
+        }
 
-    .wrap {{
+    .wrap {
       border: 1px solid #999;
       border-radius: 6px;
       background: #fafafa;
       padding: 10px;
       overflow-x: auto;
       -webkit-text-size-adjust: none;
-    }}
-    table {{ width: 100%; min-width: 1100px; font-size: 10px; border-collapse: collapse; }}
-    th {{ text-align: left; padding: 4px; border-bottom: 1px solid #999; font-weight: bold; position: sticky; top: 0; background: #fafafa; }}
-    td {{ padding: 4px; border-bottom: 1px solid #ddd; vertical-align: top; }}
-    tr:last-child td {{ border-bottom: none; }}
-    .result-w {{ color: #0a7c0a; font-weight: bold; }}
-    .result-l {{ color: #c41e3a; font-weight: bold; }}
+    }
+    table { width: 100%; min-width: 1100px; font-size: 10px; border-collapse: collapse; }
+    th { text-align: left; padding: 4px; border-bottom: 1px solid #999; font-weight: bold; position: sticky; top: 0; background: #fafafa; }
+    td { padding: 4px; border-bottom: 1px solid #ddd; vertical-align: top; }
+    tr:last-child td { border-bottom: none; }
+    .result-w { color: #0a7c0a; font-weight: bold; }
+    .result-l { color: #c41e3a; font-weight: bold; }
   </style>
 </head>
 <body>
   <div class="timestamp">
-    <div class="timestamp">Generated: {generated_ts}</div>
+    <div class="timestamp">Generated: ${generated_ts}</div>
   </div>
 
   <h1>Recent Legacy Drives (REG + POST)</h1>
-  <div class="subtitle">Most recent first | Seasons: {min_season}-{CURRENT_SEASON}</div>
+  <div class="subtitle">Most recent first | Seasons: ${min_season}-${current_season}</div>
   <div class="subtitle">Scroll down for older drives (last 5 seasons).</div>
 
   <div class="wrap">
@@ -962,7 +1224,9 @@ def generate_recent_legacy_drives_html(all_rows: List[LegacyDriveData]) -> str:
         </tr>
       </thead>
       <tbody>
-        {''.join(table_rows)}
+        """)
+
+_RECENT_FOOTER = """
       </tbody>
     </table>
   </div>
@@ -970,21 +1234,185 @@ def generate_recent_legacy_drives_html(all_rows: List[LegacyDriveData]) -> str:
 </html>
 """
 
+_esc_cache: Dict[str, str] = {}
+
+def esc(x: Any) -> str:
+    # Single C-level pass instead of four chained .replace scans, memoized for
+    # short strings: team codes, periods, downs and week labels repeat
+    # thousands of times across rows. Long one-off play descriptions are not
+    # cached, and the cap keeps the cache from growing without bound.
+    if x is None:
+        return ""
+    s = x if type(x) is str else str(x)
+    v = _esc_cache.get(s)
+    if v is None:
+        v = s.translate(_HTML_ESC_TABLE)
+        if len(s) <= 64 and len(_esc_cache) < 4096:
+            _esc_cache[s] = v
+    return v
+
+_esc_b_cache: Dict[str, bytes] = {}
+
+def esc_b(x: Any) -> bytes:
+    # esc() for the bytes writer: escape and encode in one go, with the same
+    # bounded memo so repeated short strings cache their encoded form too.
+    if x is None:
+        return b""
+    s = x if type(x) is str else str(x)
+    v = _esc_b_cache.get(s)
+    if v is None:
+        v = s.translate(_HTML_ESC_TABLE).encode("ascii", "xmlcharrefreplace")
+        if len(s) <= 64 and len(_esc_b_cache) < 4096:
+            _esc_b_cache[s] = v
+    return v
+
+def generate_recent_legacy_drives_html(all_rows: List[LegacyDriveData], out: BinaryIO) -> None:
+    """Stream the recent-drives page to ``out`` chunk by chunk."""
+    generated_ts = datetime.now().strftime("%Y-%m-%d %H:%M")
+    min_season = CURRENT_SEASON - 4
+
+    # Vectorized season filter; keep the original dicts for the survivors.
+    if all_rows:
+        seasons = pd.to_numeric(pd.Series([r.get("season") for r in all_rows]), errors="coerce").fillna(0)
+        rows = [all_rows[i] for i in np.flatnonzero((seasons >= min_season).to_numpy())]
+    else:
+        rows = []
+
+    # Columnar sort keys + np.lexsort, with the numba-compiled batch parser
+    # handling the clock strings on large inputs; no tuple keys, no Python
+    # comparisons inside the sort.
+    n = len(rows)
+    if n:
+        season_key = np.fromiter((int(r.get("season") or 0) for r in rows), dtype=np.int32, count=n)
+        week_key = np.fromiter((int(r.get("week") or 0) for r in rows), dtype=np.int32, count=n)
+        game_id = np.empty(n, dtype=object)
+        game_id[:] = [str(r.get("game_id") or "") for r in rows]
+        period_ord = np.fromiter(
+            (period_order_desc(r.get("period")) for r in rows), dtype=np.int8, count=n
+        )
+        if n > 1000:
+            start_sec = np.asarray(
+                time_to_seconds_batch([r.get("start_time") for r in rows]), dtype=np.int32
+            )
+            # Match time_to_seconds_safe: unparsable clocks sort last.
+            np.putmask(start_sec, start_sec < 0, 999999)
+        else:
+            start_sec = np.fromiter(
+                (time_to_seconds_safe(r.get("start_time")) for r in rows),
+                dtype=np.int32, count=n,
+            )
+        order = np.lexsort((start_sec, -period_ord, game_id, -week_key, -season_key))
+        rows = [rows[i] for i in order]
+
+    out.write(_RECENT_HEADER_TMPL.substitute(
+        generated_ts=generated_ts,
+        min_season=min_season,
+        current_season=CURRENT_SEASON,
+    ).encode("utf-8"))
+
+    # One %-format per row, written straight to ``out`` as bytes; the
+    # itemgetter pulls all seventeen fields in a single C call, and every
+    # fragment is already encoded so the handle writes without re-encoding.
+    write = out.write
+    row_fmt = _RECENT_ROW_FMT_B
+    for r in rows:
+        (qb_name, result, season, week_label, week, away_team, home_team,
+         period, score_diff, st, et, final_down, final_ydstogo, final_play,
+         end_team_score, end_opp_score, reason) = _row_get(r)
+        result = result or ""
+        st = st or ""
+        et = et or ""
+        write(
+            row_fmt % (
+                esc_b(qb_name or ""),
+                b"result-w" if result == "W" else b"result-l",
+                esc_b(result),
+                esc_b(season or ""),
+                esc_b(week_label or week or ""),
+                esc_b(away_team or ""),
+                esc_b(home_team or ""),
+                esc_b(period or ""),
+                esc_b(score_diff or ""),
+                esc_b(f"{st}-{et}" if st and et else (st or et or "")),
+                esc_b(final_down or ""),
+                esc_b(final_ydstogo or ""),
+                esc_b(final_play or ""),
+                esc_b(f"{end_team_score}-{end_opp_score}"),
+                esc_b(reason or ""),
+            )
+        )
+
+    out.write(_RECENT_FOOTER.encode("ascii"))
+
+def _atomic_write(path: str, data: str) -> None:
+    # Write-to-tmp-then-rename: one big buffered write, and readers never
+    # observe a truncated file if the process dies mid-write.
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8", buffering=1 << 20) as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+def _render_is_current(stamp_key: str) -> bool:
+    if not os.path.exists(RENDER_STAMP):
+        return False
+    if not all(os.path.exists(p) for p in OUTPUT_HTML_FILES):
+        return False
+    with open(RENDER_STAMP, "r", encoding="utf-8") as f:
+        return f.read().strip() == stamp_key
+
+def _split_by_season_type(
+    items: Sequence[Dict[str, Any]],
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    # season_type is canonicalized to upper-case at load/build time, so each
+    # element costs one dict lookup and one interned-string compare.
+    reg = [it for it in items if it.get("season_type") == "REG"]
+    post = [it for it in items if it.get("season_type") == "POST"]
+    return reg, post
+
 def _normalize_cached_opportunities(opps: List[Opportunity]) -> List[Opportunity]:
-    out: List[Opportunity] = []
+    # Canonicalize season_type to upper-case once here so every later split
+    # and sort can use a plain equality test instead of str(...).upper().
+    # Mutates and returns the list it is given; no O(n) copies.
+    w = 0
     for o in opps:
         if not isinstance(o, dict):
             continue
-        if "season_type" not in o:
-            o = {**o, "season_type": "REG"}
-        out.append(o)
-    return out
+        st = str(o.get("season_type") or "REG").upper()
+        if o.get("season_type") != st:
+            o = {**o, "season_type": st}
+        opps[w] = o
+        w += 1
+    del opps[w:]
+    return opps
+
+def _normalize_cached_rows(rows: List[LegacyDriveData]) -> List[LegacyDriveData]:
+    # Same in-place one-shot season_type canonicalization for the display rows.
+    w = 0
+    for r in rows:
+        if not isinstance(r, dict):
+            continue
+        st = str(r.get("season_type") or "REG").upper()
+        if r.get("season_type") != st:
+            r = {**r, "season_type": st}
+        # Guarantee the full key set the itemgetter-based renderer relies on.
+        missing = [k for k in _ROW_KEYS if k not in r]
+        if missing:
+            r = {**r, **dict.fromkeys(missing)}
+        rows[w] = r
+        w += 1
+    del rows[w:]
+    return rows
 
 def main() -> None:
+    # If no delta file is present now, this environment did not preserve the
+    # last run's delta (or none was ever written) — appending would then add
+    # state that never reaches the base cache, so such runs must save fully.
+    delta_survived = os.path.exists(LEGACY_DRIVE_DELTA)
     cached_opportunities, processed_games, last_season_processed, cached_rows = load_legacydrive_cache()
-    cached_opportunities = _normalize_cached_opportunities(list(cached_opportunities))
+    opportunities = _normalize_cached_opportunities(cached_opportunities)
+    legacydrive_rows = _normalize_cached_rows(cached_rows)
 
-    print(f"Loaded {len(cached_opportunities)} cached opportunities from {len(processed_games)} games")
+    print(f"Loaded {len(opportunities)} cached opportunities from {len(processed_games)} games")
     print(f"Last season fully processed: {last_season_processed}")
 
     seasons = seasons_to_load(last_season_processed, CURRENT_SEASON)
@@ -1002,21 +1430,34 @@ def main() -> None:
     new_games = all_games - processed_games
     print(f"Found {len(new_games)} new games to process")
 
-    pbp_new = pbp_all[pbp_all["game_id"].isin(new_games)] if new_games else pd.DataFrame()
+    if new_games:
+        # Factorize once and match integer codes; only the unique game_ids are
+        # hashed against the set rather than every row.
+        codes, uniques = pd.factorize(pbp_all["game_id"], sort=False)
+        new_codes = np.flatnonzero(uniques.isin(new_games))
+        pbp_new = pbp_all.iloc[np.flatnonzero(np.isin(codes, new_codes))]
+    else:
+        pbp_new = pd.DataFrame()
 
     # Name maps for display (merge persistent map with the latest).
-    passer_name_map: Dict[Any, str] = pbp_all.groupby("passer_id")["passer"].first().to_dict() if "passer_id" in pbp_all.columns else {}
+    passer_name_map: Dict[Any, str] = {}
+    if "passer_id" in pbp_all.columns:
+        passer_name_map = _first_name_map(pbp_all, "passer_id", "passer")
     qb_name_map: Dict[Any, str] = {}
     if "qb_id" in pbp_all.columns and "qb" in pbp_all.columns:
-        qb_name_map = pbp_all.groupby("qb_id")["qb"].first().to_dict()
+        qb_name_map = _first_name_map(pbp_all, "qb_id", "qb")
 
     persistent_name_map = load_persistent_name_map()
     passer_name_map = {**persistent_name_map, **passer_name_map}
 
-    opportunities = list(cached_opportunities)
-    legacydrive_rows = list(cached_rows)
+    # Everything below works off pbp_new and the name maps; release the full
+    # multi-season frame before the processing stage.
+    del pbp_all
+    gc.collect()
 
     if not pbp_new.empty:
+        n_opps_before = len(opportunities)
+        n_rows_before = len(legacydrive_rows)
         process_new_games(pbp_new, new_games, opportunities, legacydrive_rows, passer_name_map, qb_name_map)
         processed_games.update(new_games)
 
@@ -1026,7 +1467,22 @@ def main() -> None:
         elif len(seasons) > 1:
             last_season_processed = CURRENT_SEASON - 1
 
-        save_legacydrive_cache(opportunities, processed_games, last_season_processed, legacydrive_rows)
+        # Append just this run's additions when a base cache exists, the
+        # delta demonstrably persists here, and it is still small; anything
+        # else gets a full compacting save.
+        if (
+            os.path.exists(LEGACY_DRIVE_CACHE)
+            and delta_survived
+            and os.path.getsize(LEGACY_DRIVE_DELTA) < DELTA_COMPACT_BYTES
+        ):
+            append_legacydrive_cache(
+                opportunities[n_opps_before:],
+                new_games,
+                last_season_processed,
+                legacydrive_rows[n_rows_before:],
+            )
+        else:
+            save_legacydrive_cache(opportunities, processed_games, last_season_processed, legacydrive_rows)
         save_persistent_name_map(passer_name_map)
         print(f"Processed {len(new_games)} new games. Total opportunities: {len(opportunities)}")
     else:
@@ -1039,32 +1495,53 @@ def main() -> None:
         print("No legacy drive opportunities found.")
         return
 
+    # Rendering is the dominant cost on no-op runs; skip it when the cache
+    # contents match what the existing HTML files were generated from. The
+    # name map feeds the rendered leaderboard names, so digest it into the
+    # key — fresh name data can arrive with no change in row counts.
+    hasher = hashlib.blake2b(
+        f"{len(opportunities)}-{len(legacydrive_rows)}-{last_season_processed}".encode()
+    )
+    for k in sorted(passer_name_map, key=str):
+        hasher.update(f"|{k}={passer_name_map[k]}".encode())
+    stamp_key = hasher.hexdigest()
+    if _render_is_current(stamp_key):
+        print("HTML outputs up to date; skipping render.")
+        return
+
     # Split cached content by season type for the two tabs.
-    opp_reg = [o for o in opportunities if str(o.get("season_type") or "").upper() == "REG"]
-    opp_post = [o for o in opportunities if str(o.get("season_type") or "").upper() == "POST"]
+    opp_reg, opp_post = _split_by_season_type(opportunities)
     rows_sorted = sort_legacydrive_rows(legacydrive_rows)
-    rows_reg = [r for r in rows_sorted if str(r.get("season_type") or "").upper() == "REG"]
-    rows_post = [r for r in rows_sorted if str(r.get("season_type") or "").upper() == "POST"]
+    rows_reg, rows_post = _split_by_season_type(rows_sorted)
 
     reg_records = build_leaderboard_records(opp_reg, passer_name_map)
     post_records = build_leaderboard_records(opp_post, passer_name_map)
 
-    reg_html, post_html = generate_leaderboards_html(
-    reg_records=reg_records,
-    post_records=post_records,
-    reg_rows=rows_reg,
-    post_rows=rows_post,
-)
-    recent_html = generate_recent_legacy_drives_html(legacydrive_rows)
-
-    with open("regular_season_legacy_drives_leaderboard.html", "w", encoding="utf-8") as f:
-        f.write(reg_html)
-
-    with open("post_season_legacy_drives_leaderboard.html", "w", encoding="utf-8") as f:
-        f.write(post_html)
-
-    with open("recent_legacy_drives.html", "w", encoding="utf-8") as f:
-        f.write(recent_html)
+    def _write_leaderboards() -> None:
+        reg_html, post_html = generate_leaderboards_html(
+            reg_records=reg_records,
+            post_records=post_records,
+            reg_rows=rows_reg,
+            post_rows=rows_post,
+        )
+        _atomic_write(OUTPUT_HTML_FILES[0], reg_html)
+        _atomic_write(OUTPUT_HTML_FILES[1], post_html)
+
+    def _write_recent() -> None:
+        # Stream the (much larger) recent-drives page instead of building one
+        # giant string in memory; the buffer keeps actual disk writes chunky.
+        tmp = OUTPUT_HTML_FILES[2] + ".tmp"
+        with open(tmp, "wb", buffering=1 << 20) as f:
+            generate_recent_legacy_drives_html(legacydrive_rows, f)
+        os.replace(tmp, OUTPUT_HTML_FILES[2])
+
+    # The leaderboard pair and the recent page are independent; overlap their
+    # C-level string work and disk writes in a small thread pool.
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        for fut in [ex.submit(_write_leaderboards), ex.submit(_write_recent)]:
+            fut.result()
+
+    _atomic_write(RENDER_STAMP, stamp_key)
 
     print("\nGenerated regular_season_legacy_drives_leaderboard.html")
     print("Generated post_season_legacy_drives_leaderboard.html")